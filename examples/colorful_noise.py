@@ -33,8 +33,8 @@ noise_v = PerlinNoise(seed=300)
 scale = 0.005
 
 # Create coordinate grids
-x_coords = np.arange(width) * scale
-y_coords = np.arange(height) * scale
+x_coords = np.arange(width, dtype=np.float32) * scale
+y_coords = np.arange(height, dtype=np.float32) * scale
 xx, yy = np.meshgrid(x_coords, y_coords)
 
 # Generate noise for ALL pixels at once using Numba JIT (FAST!)
@@ -52,15 +52,7 @@ v_values = v_values * 0.2 + 0.8  # Map [-1, 1] to [0.6, 1.0]
 
 # Convert HSV to RGB and fill canvas
 print("  Converting to RGB and filling canvas...")
-for y in range(height):
-    for x in range(width):
-        h = float(h_values[y, x])
-        s = float(np.clip(s_values[y, x], 0, 1))
-        v = float(np.clip(v_values[y, x], 0, 1))
-
-        # Create color from HSV
-        color = Color.from_hsv(h, s, v)
-        canvas.set_pixel(x, y, color)
+canvas.set_pixels(Color.from_hsv_array(h_values, s_values, v_values))
 
 elapsed = time.time() - start
 print(f"Generated in {elapsed:.2f}s ({width * height / elapsed:,.0f} pixels/sec)")
@@ -9,13 +9,44 @@ import time
 from pathlib import Path
 
 import numpy as np
+from numba import njit, prange
 
-from myon import Canvas, Color, PerlinNoise
+from myon import Canvas, PerlinNoise
+from myon.utils import make_grid
 
 # Create output directory
 output_dir = Path(__file__).parent / "output"
 output_dir.mkdir(exist_ok=True)
 
+
+@njit(fastmath=True, cache=True, inline="always")
+def _hsv_channel(n, h, s, v):
+    """One RGB channel of an HSV color (n = 5, 3, 1 for R, G, B), without branching."""
+    k = (n + h / 60.0) % 6.0
+    return v - v * s * max(0.0, min(k, 4.0 - k, 1.0))
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def noise_to_rgb(flow, detail, out):
+    """Map flow and detail noise to RGB, writing uint8 pixels into ``out``."""
+    for i in prange(flow.shape[0]):
+        for j in range(flow.shape[1]):
+            d = detail[i, j]
+            # Combine flow and detail
+            c = flow[i, j] * 0.8 + d * 0.2
+
+            # Map to hue range for beautiful color transitions
+            h = (c * 180.0 + 180.0) % 360.0
+            # Saturation varies with detail for visual interest
+            s = min(max(0.6 + d * 0.4, 0.3), 1.0)
+            # Value/brightness varies smoothly
+            v = min(max(0.5 + c * 0.3 + d * 0.2, 0.4), 1.0)
+
+            out[i, j, 0] = int(_hsv_channel(5.0, h, s, v) * 255.0)
+            out[i, j, 1] = int(_hsv_channel(3.0, h, s, v) * 255.0)
+            out[i, j, 2] = int(_hsv_channel(1.0, h, s, v) * 255.0)
+
+
 # Create canvas
 width, height = 1600, 1200
 canvas = Canvas(width, height)
@@ -31,18 +62,21 @@ noise_detail = PerlinNoise(seed=789)
 
 # Create coordinate grids
 scale = 3.0  # Zoom level
-x_coords = np.linspace(0, scale, width)
-y_coords = np.linspace(0, scale, height)
-xx, yy = np.meshgrid(x_coords, y_coords)
+x_coords, y_coords = make_grid(width, height, 0, scale, 0, scale)
+xx, yy = np.meshgrid(x_coords.astype(np.float32), y_coords.astype(np.float32))
 
 print("  Computing domain warping...")
 # Domain warping for organic distortion
-warp_x = noise_warp_x.octave_noise(xx * 2, yy * 2, octaves=4, persistence=0.5)
-warp_y = noise_warp_y.octave_noise(xx * 2, yy * 2, octaves=4, persistence=0.5)
+# Both warp fields sample the same scaled grid, so build it once
+xx2, yy2 = xx * 2, yy * 2
+# Each warp field is consumed right away, so both share one scratch buffer
+warp = np.empty_like(xx)
 
 # Apply warping
-warped_x = xx + warp_x * 0.3
-warped_y = yy + warp_y * 0.3
+noise_warp_x.octave_noise(xx2, yy2, octaves=4, persistence=0.5, out=warp)
+warped_x = xx + warp * 0.3
+noise_warp_y.octave_noise(xx2, yy2, octaves=4, persistence=0.5, out=warp)
+warped_y = yy + warp * 0.3
 
 print("  Computing color field...")
 # Main color flow through warped space
@@ -53,30 +87,10 @@ print("  Adding fine details...")
 detail = noise_detail.octave_noise(xx * 10, yy * 10, octaves=6, persistence=0.4)
 
 print("  Generating colors...")
-# Combine flow and detail
-combined = flow * 0.8 + detail * 0.2
-
-# Create color mapping with smooth gradients
-# Map to hue range for beautiful color transitions
-hue = (combined * 180 + 180) % 360  # Cycle through colors
-
-# Saturation varies with detail for visual interest
-saturation = np.clip(0.6 + detail * 0.4, 0.3, 1.0)
-
-# Value/brightness varies smoothly
-value = np.clip(0.5 + combined * 0.3 + detail * 0.2, 0.4, 1.0)
-
-# Fill canvas with generated colors
-for y in range(height):
-    if y % 100 == 0:
-        print(f"  Processing row {y}/{height}...")
-    for x in range(width):
-        h = float(hue[y, x])
-        s = float(saturation[y, x])
-        v = float(value[y, x])
-
-        color = Color.from_hsv(h, s, v)
-        canvas.set_pixel(x, y, color)
+# Color mapping, HSV conversion and the uint8 store happen in one pass
+rgb = np.empty((height, width, 3), dtype=np.uint8)
+noise_to_rgb(flow, detail, rgb)
+canvas.set_pixels(rgb)
 
 elapsed = time.time() - start
 total_pixels = width * height
@@ -10,7 +10,7 @@ from pathlib import Path
 
 import numpy as np
 
-from myon import Canvas, Color, PerlinNoise
+from myon import Canvas, PerlinNoise
 
 # Create output directory
 output_dir = Path(__file__).parent / "output"
@@ -30,8 +30,8 @@ start = time.time()
 scale = 0.01  # Scale factor for noise coordinates
 
 # Create coordinate grids (vectorized approach)
-x_coords = np.arange(width) * scale
-y_coords = np.arange(height) * scale
+x_coords = np.arange(width, dtype=np.float32) * scale
+y_coords = np.arange(height, dtype=np.float32) * scale
 xx, yy = np.meshgrid(x_coords, y_coords)
 
 # Generate noise for ALL pixels at once using Numba JIT
@@ -41,10 +41,7 @@ values = noise.octave_noise(xx, yy, octaves=4, persistence=0.5)
 gray_values = ((values + 1) * 127.5).astype(np.uint8)
 
 # Fill canvas with noise values
-for y in range(height):
-    for x in range(width):
-        gray = int(gray_values[y, x])
-        canvas.set_pixel(x, y, Color(gray, gray, gray))
+canvas.set_channels(gray_values, gray_values, gray_values)
 
 elapsed = time.time() - start
 print(f"Generated in {elapsed:.2f}s ({width * height / elapsed:,.0f} pixels/sec)")
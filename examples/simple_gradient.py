@@ -3,6 +3,8 @@
 
 from pathlib import Path
 
+import numpy as np
+
 from myon import Canvas, Color
 
 # Create output directory
@@ -16,13 +18,10 @@ canvas = Canvas(800, 600)
 blue = Color(0, 100, 200)
 red = Color(200, 50, 50)
 
-# Draw horizontal gradient
-for x in range(canvas.width):
-    t = x / canvas.width
-    color = blue.lerp(red, t)
-
-    for y in range(canvas.height):
-        canvas.set_pixel(x, y, color)
+# Draw horizontal gradient: compute one row, then broadcast it down the canvas
+t = np.arange(canvas.width) / canvas.width
+row = Color.lerp_array(blue, red, t)
+canvas.set_pixels(np.broadcast_to(row, (canvas.height, canvas.width, 3)))
 
 # Save result
 canvas.save(output_dir / "gradient.png")
@@ -1,5 +1,6 @@
 """Canvas module for creating and manipulating images."""
 
+from io import BytesIO
 from pathlib import Path
 
 import numpy as np
@@ -7,6 +8,15 @@ from PIL import Image
 
 from myon.color import Color
 
+# Dirty tracking groups pixels into 64x64 tiles (1 << 6)
+_TILE_SHIFT = 6
+
+
+def _pack(color: Color) -> int:
+    """Pack a color into a uint32 whose memory bytes are R, G, B, A."""
+    rgba = np.array([color.r, color.g, color.b, color.a], dtype=np.uint8)
+    return int(rgba.view(np.uint32)[0])
+
 
 class Canvas:
     """A canvas for generative art drawing.
@@ -14,23 +24,57 @@ class Canvas:
     The canvas uses a coordinate system where (0, 0) is the top-left corner.
     """
 
-    def __init__(self, width: int, height: int, background: Color | None = None) -> None:
+    __slots__ = (
+        "width",
+        "height",
+        "mode",
+        "_background",
+        "_packed",
+        "_pixels",
+        "_encoded",
+        "_dirty_tiles",
+        "_all_dirty",
+    )
+
+    def __init__(
+        self, width: int, height: int, background: Color | None = None, mode: str = "RGB"
+    ) -> None:
         """Initialize a new canvas.
 
         Args:
             width: Canvas width in pixels
             height: Canvas height in pixels
             background: Background color (defaults to white)
+            mode: Internal pixel layout. "RGB" stores interleaved bytes; "RGBA"
+                stores one packed uint32 per pixel, which makes fills and
+                palette lookups (see ``set_packed``) single whole-word stores
         """
         if width <= 0 or height <= 0:
             raise ValueError("Canvas dimensions must be positive")
+        if mode not in ("RGB", "RGBA"):
+            raise ValueError(f"Unsupported canvas mode: {mode}")
 
         self.width = width
         self.height = height
+        self.mode = mode
         self._background = background or Color(255, 255, 255)
+        # (format, bytes) from the last encoded save; reset whenever pixels change
+        self._encoded: tuple[str, bytes] | None = None
+        # (tile_x, tile_y) of tiles touched by single-pixel writes since mark_clean()
+        self._dirty_tiles: set[tuple[int, int]] = set()
+        self._all_dirty = True
 
-        # Initialize pixel array (height, width, RGB)
-        self._pixels = np.full((height, width, 3), self._background.to_array(), dtype=np.uint8)
+        self._packed: np.ndarray[tuple[int, int], np.dtype[np.uint32]] | None
+        if mode == "RGBA":
+            # Packed words with an (height, width, RGB) byte view over the same memory
+            self._packed = np.empty((height, width), dtype=np.uint32)
+            self._pixels = self._packed.view(np.uint8).reshape(height, width, 4)[..., :3]
+        else:
+            self._packed = None
+            # Initialize pixel array (height, width, RGB)
+            self._pixels = np.empty((height, width, 3), dtype=np.uint8)
+
+        self.fill(self._background)
 
     @property
     def shape(self) -> tuple[int, int]:
@@ -46,7 +90,77 @@ class Canvas:
             color: Color to set
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            self._pixels[y, x] = color.to_array()
+            self._pixels[y, x] = color.to_tuple()
+            self._encoded = None
+            if not self._all_dirty:
+                self._dirty_tiles.add((x >> _TILE_SHIFT, y >> _TILE_SHIFT))
+
+    def set_pixels(self, pixels: np.ndarray[tuple[int, int, int], np.dtype[np.uint8]]) -> None:
+        """Set every pixel at once from an RGB array.
+
+        Args:
+            pixels: Array of shape (height, width, 3) with dtype uint8
+        """
+        pixels = np.asarray(pixels)
+        if pixels.shape != self._pixels.shape:
+            raise ValueError(
+                f"Pixel array shape {pixels.shape} does not match canvas {self._pixels.shape}"
+            )
+        if pixels.dtype != np.uint8:
+            raise ValueError(f"Pixel array dtype must be uint8, got {pixels.dtype}")
+        self._pixels[...] = pixels
+        self._mark_all_dirty()
+
+    def set_channels(
+        self,
+        r: np.ndarray[tuple[int, int], np.dtype[np.uint8]],
+        g: np.ndarray[tuple[int, int], np.dtype[np.uint8]],
+        b: np.ndarray[tuple[int, int], np.dtype[np.uint8]],
+    ) -> None:
+        """Set every pixel at once from separate channel planes.
+
+        Each plane is written straight into the canvas, so callers that
+        compute channels separately don't need to stack them first.
+
+        Args:
+            r: Red plane of shape (height, width) with dtype uint8
+            g: Green plane of shape (height, width) with dtype uint8
+            b: Blue plane of shape (height, width) with dtype uint8
+        """
+        planes = [np.asarray(plane) for plane in (r, g, b)]
+        for plane in planes:
+            if plane.shape != self._pixels.shape[:2]:
+                raise ValueError(
+                    f"Channel shape {plane.shape} does not match canvas {self._pixels.shape[:2]}"
+                )
+            if plane.dtype != np.uint8:
+                raise ValueError(f"Channel dtype must be uint8, got {plane.dtype}")
+
+        for index, plane in enumerate(planes):
+            self._pixels[..., index] = plane
+        self._mark_all_dirty()
+
+    def set_packed(self, packed: np.ndarray[tuple[int, int], np.dtype[np.uint32]]) -> None:
+        """Set every pixel at once from packed RGBA words (RGBA mode only).
+
+        Each word holds the bytes R, G, B, A in memory order, e.g. a
+        (..., 4) uint8 array viewed as uint32. This makes LUT coloring a
+        single gather: ``canvas.set_packed(palette[indices])``.
+
+        Args:
+            packed: Array of shape (height, width) with dtype uint32
+        """
+        if self._packed is None:
+            raise ValueError("set_packed requires a canvas created with mode='RGBA'")
+        packed = np.asarray(packed)
+        if packed.shape != self._packed.shape:
+            raise ValueError(
+                f"Packed array shape {packed.shape} does not match canvas {self._packed.shape}"
+            )
+        if packed.dtype != np.uint32:
+            raise ValueError(f"Packed array dtype must be uint32, got {packed.dtype}")
+        self._packed[...] = packed
+        self._mark_all_dirty()
 
     def get_pixel(self, x: int, y: int) -> Color:
         """Get a single pixel color.
@@ -68,7 +182,47 @@ class Canvas:
         Args:
             color: Color to fill with
         """
-        self._pixels[:] = color.to_array()
+        if self._packed is not None:
+            self._packed.fill(_pack(color))
+        else:
+            # Broadcasting a 3-element color over the whole image is slow, so set
+            # one row and copy it down as contiguous row-sized blocks instead
+            self._pixels[0] = color.to_tuple()
+            self._pixels[1:] = self._pixels[0]
+        self._mark_all_dirty()
+
+    def _mark_all_dirty(self) -> None:
+        """Record a whole-canvas change."""
+        self._encoded = None
+        self._all_dirty = True
+        self._dirty_tiles.clear()
+
+    def dirty_regions(self) -> list[tuple[int, int, int, int]]:
+        """Get the regions changed since the last call to ``mark_clean``.
+
+        Single-pixel writes are tracked per 64x64 tile; whole-canvas
+        operations (fills and bulk setters) mark the entire canvas.
+
+        Returns:
+            List of (x0, y0, x1, y1) rectangles with exclusive x1 and y1,
+            clipped to the canvas and ordered row by row
+        """
+        if self._all_dirty:
+            return [(0, 0, self.width, self.height)]
+        return [
+            (
+                tx << _TILE_SHIFT,
+                ty << _TILE_SHIFT,
+                min((tx + 1) << _TILE_SHIFT, self.width),
+                min((ty + 1) << _TILE_SHIFT, self.height),
+            )
+            for ty, tx in sorted((ty, tx) for tx, ty in self._dirty_tiles)
+        ]
+
+    def mark_clean(self) -> None:
+        """Forget tracked changes, e.g. after a consumer has used ``dirty_regions``."""
+        self._all_dirty = False
+        self._dirty_tiles.clear()
 
     def clear(self) -> None:
         """Clear canvas to background color."""
@@ -78,39 +232,69 @@ class Canvas:
     def pixels(self) -> np.ndarray[tuple[int, int, int], np.dtype[np.uint8]]:
         """Get read-only view of pixel array.
 
+        The view shares memory with the canvas and cannot be written to; call
+        ``.copy()`` on it for a mutable snapshot.
+
         Returns:
             NumPy array of shape (height, width, 3)
         """
-        return self._pixels.copy()
+        view = self._pixels.view()
+        view.flags.writeable = False
+        return view
 
     def save(self, filepath: Path | str, format: str | None = None) -> None:
         """Save canvas to an image file.
 
         Args:
             filepath: Path to save the image
-            format: Image format (PNG, JPEG, etc.). If None, inferred from filename
+            format: Image format (PNG, JPEG, etc.). If None, inferred from filename.
+                PPM is written directly without going through PIL. Other formats
+                reuse the previous encoding when the canvas hasn't changed since.
         """
         filepath = Path(filepath)
+
+        if format:
+            fmt = format.upper()
+        else:
+            suffix = filepath.suffix.lower()
+            if suffix not in Image.registered_extensions():
+                raise ValueError(f"Unknown file extension: {filepath.suffix!r}")
+            fmt = Image.registered_extensions()[suffix]
+
         filepath.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == "PPM":
+            # Binary PPM is a short header plus the raw RGB bytes, no encoder needed
+            with filepath.open("wb") as f:
+                f.write(f"P6\n{self.width} {self.height}\n255\n".encode("ascii"))
+                self._pixels.tofile(f)
+            return
 
-        image = Image.fromarray(self._pixels, mode="RGB")
-        image.save(filepath, format=format)
+        if self._encoded is None or self._encoded[0] != fmt:
+            buffer = BytesIO()
+            Image.fromarray(self._pixels, mode="RGB").save(buffer, format=fmt)
+            self._encoded = (fmt, buffer.getvalue())
+        filepath.write_bytes(self._encoded[1])
 
     @classmethod
-    def from_image(cls, filepath: Path | str) -> "Canvas":
+    def from_image(cls, filepath: Path | str, mode: str = "RGB") -> "Canvas":
         """Create a canvas from an existing image file.
 
         Args:
             filepath: Path to the image file
+            mode: Internal pixel layout of the new canvas ("RGB" or "RGBA")
 
         Returns:
             New Canvas instance with image data
         """
-        image = Image.open(filepath).convert("RGB")
+        image = Image.open(filepath).convert(mode)
         width, height = image.size
 
-        canvas = cls(width, height)
-        canvas._pixels = np.array(image, dtype=np.uint8)
+        canvas = cls(width, height, mode=mode)
+        if mode == "RGBA":
+            # RGBA bytes reinterpret directly as the packed words
+            canvas.set_packed(np.asarray(image, dtype=np.uint8).view(np.uint32)[..., 0])
+        else:
+            canvas._pixels = np.array(image, dtype=np.uint8)
         return canvas
 
     def __repr__(self) -> str:
@@ -1,6 +1,52 @@
 """Color module for handling colors in various formats."""
 
 import numpy as np
+import numpy.typing as npt
+
+
+def _clamp(value: float) -> int:
+    """Clamp value to valid color range [0, 255]."""
+    value = int(value)
+    return 0 if value < 0 else (255 if value > 255 else value)
+
+
+def hsv_to_rgb(
+    h: npt.ArrayLike, s: npt.ArrayLike, v: npt.ArrayLike
+) -> np.ndarray[tuple[int, ...], np.dtype[np.uint8]]:
+    """Convert arrays of HSV values to RGB in one vectorized pass.
+
+    Uses the same formula as ``Color.from_hsv``, so float64 inputs give
+    identical results, but operates on whole arrays at once instead of
+    building one Color per pixel.
+
+    Args:
+        h: Hue array (0-360)
+        s: Saturation array (0-1)
+        v: Value/brightness array (0-1)
+
+    Returns:
+        Array of shape (*h.shape, 3) with dtype uint8
+    """
+    # Work in float32 when the inputs already are (e.g. noise output), so the
+    # channels are cast at most once instead of being upcast to float64 copies
+    h_arr, s_arr, v_arr = np.asarray(h), np.asarray(s), np.asarray(v)
+    dtype = np.result_type(h_arr, s_arr, v_arr, np.float32)
+    hue = np.mod(h_arr.astype(dtype, copy=False), 360)
+    sat = np.clip(s_arr.astype(dtype, copy=False), 0.0, 1.0)
+    val = np.clip(v_arr.astype(dtype, copy=False), 0.0, 1.0)
+
+    # Same branchless form as Color.from_hsv: channel n is v - v*s*clamp(min(k, 4 - k), 0, 1)
+    # with k = (n + h/60) mod 6, for n = 5, 3, 1 (red, green, blue)
+    h6 = hue / 60
+    c = val * sat
+    channels = []
+    for n in (5, 3, 1):
+        k = np.mod(n + h6, 6)
+        channels.append(val - c * np.clip(np.minimum(k, 4 - k), 0, 1))
+
+    rgb = np.stack(channels, axis=-1) * 255
+    result: np.ndarray[tuple[int, ...], np.dtype[np.uint8]] = np.clip(rgb, 0, 255).astype(np.uint8)
+    return result
 
 
 class Color:
@@ -9,6 +55,8 @@ class Color:
     Color values are stored as integers in the range [0, 255].
     """
 
+    __slots__ = ("_r", "_g", "_b", "_a", "_key")
+
     def __init__(self, r: int, g: int, b: int, a: int = 255) -> None:
         """Initialize a color.
 
@@ -18,15 +66,25 @@ class Color:
             b: Blue component (0-255)
             a: Alpha/transparency component (0-255, default 255)
         """
-        self._r = self._clamp(r)
-        self._g = self._clamp(g)
-        self._b = self._clamp(b)
-        self._a = self._clamp(a)
+        self._r = _clamp(r)
+        self._g = _clamp(g)
+        self._b = _clamp(b)
+        self._a = _clamp(a)
+        self._key = (self._r, self._g, self._b, self._a)
 
-    @staticmethod
-    def _clamp(value: int) -> int:
-        """Clamp value to valid color range [0, 255]."""
-        return max(0, min(255, int(value)))
+    @classmethod
+    def _unchecked(cls, r: int, g: int, b: int, a: int = 255) -> "Color":
+        """Create a color from components already known to be in [0, 255].
+
+        Skips clamping; only for internal factories that guarantee the range.
+        """
+        color = object.__new__(cls)
+        color._r = r
+        color._g = g
+        color._b = b
+        color._a = a
+        color._key = (r, g, b, a)
+        return color
 
     @property
     def r(self) -> int:
@@ -71,13 +129,16 @@ class Color:
             New Color instance
         """
         hex_string = hex_string.lstrip("#")
-        if len(hex_string) != 6:
+        # isalnum rules out the signs, underscores and whitespace int() would accept
+        if len(hex_string) != 6 or not (hex_string.isascii() and hex_string.isalnum()):
             raise ValueError(f"Invalid hex color string: {hex_string}")
 
-        r = int(hex_string[0:2], 16)
-        g = int(hex_string[2:4], 16)
-        b = int(hex_string[4:6], 16)
-        return cls(r, g, b)
+        try:
+            value = int(hex_string, 16)
+        except ValueError:
+            raise ValueError(f"Invalid hex color string: {hex_string}") from None
+
+        return cls._unchecked((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
 
     @classmethod
     def from_hsv(cls, h: float, s: float, v: float) -> "Color":
@@ -95,28 +156,34 @@ class Color:
         s = max(0.0, min(1.0, s))
         v = max(0.0, min(1.0, v))
 
+        # Branchless form: channel n is v - v*s*clamp(min(k, 4 - k), 0, 1)
+        # with k = (n + h/60) mod 6, for n = 5, 3, 1 (red, green, blue)
+        h6 = h / 60
         c = v * s
-        x = c * (1 - abs((h / 60) % 2 - 1))
-        m = v - c
-
-        r_val: float
-        g_val: float
-        b_val: float
-
-        if h < 60:
-            r_val, g_val, b_val = c, x, 0.0
-        elif h < 120:
-            r_val, g_val, b_val = x, c, 0.0
-        elif h < 180:
-            r_val, g_val, b_val = 0.0, c, x
-        elif h < 240:
-            r_val, g_val, b_val = 0.0, x, c
-        elif h < 300:
-            r_val, g_val, b_val = x, 0.0, c
-        else:
-            r_val, g_val, b_val = c, 0.0, x
-
-        return cls(int((r_val + m) * 255), int((g_val + m) * 255), int((b_val + m) * 255))
+        k_r = (5 + h6) % 6
+        k_g = (3 + h6) % 6
+        k_b = (1 + h6) % 6
+        r_val = v - c * max(0.0, min(k_r, 4 - k_r, 1.0))
+        g_val = v - c * max(0.0, min(k_g, 4 - k_g, 1.0))
+        b_val = v - c * max(0.0, min(k_b, 4 - k_b, 1.0))
+
+        return cls._unchecked(int(r_val * 255), int(g_val * 255), int(b_val * 255))
+
+    @staticmethod
+    def from_hsv_array(
+        h: npt.ArrayLike, s: npt.ArrayLike, v: npt.ArrayLike
+    ) -> np.ndarray[tuple[int, ...], np.dtype[np.uint8]]:
+        """Convert arrays of HSV values to an RGB array.
+
+        Args:
+            h: Hue array (0-360)
+            s: Saturation array (0-1)
+            v: Value/brightness array (0-1)
+
+        Returns:
+            Array of shape (*h.shape, 3) with dtype uint8
+        """
+        return hsv_to_rgb(h, s, v)
 
     def lerp(self, other: "Color", t: float) -> "Color":
         """Linear interpolation between two colors.
@@ -132,13 +199,51 @@ class Color:
         r = int(self._r + (other._r - self._r) * t)
         g = int(self._g + (other._g - self._g) * t)
         b = int(self._b + (other._b - self._b) * t)
-        return Color(r, g, b)
+        return Color._unchecked(r, g, b)
+
+    @staticmethod
+    def lerp_array(
+        a: "Color | npt.ArrayLike", b: "Color | npt.ArrayLike", t: npt.ArrayLike
+    ) -> np.ndarray[tuple[int, ...], np.dtype[np.uint8]]:
+        """Linear interpolation between colors at many points at once.
+
+        Matches ``Color.lerp`` for each element of ``t``. Endpoints may be
+        single colors or RGB arrays of shape (..., 3) that broadcast against
+        ``t``, e.g. one start/end pair per element. Results are clamped to
+        [0, 255] like ``Color`` components.
+
+        Args:
+            a: Start color(s)
+            b: Target color(s)
+            t: Interpolation factors (0-1), any shape
+
+        Returns:
+            Array of shape (..., 3) with dtype uint8, broadcast from ``t`` and
+            the endpoints' leading dimensions
+        """
+        start = np.asarray(a.to_tuple() if isinstance(a, Color) else a, dtype=np.float64)
+        end = np.asarray(b.to_tuple() if isinstance(b, Color) else b, dtype=np.float64)
+        for endpoint in (start, end):
+            if endpoint.ndim == 0 or endpoint.shape[-1] != 3:
+                raise ValueError(f"Color endpoints must have shape (..., 3), got {endpoint.shape}")
+
+        t_arr = np.clip(np.asarray(t, dtype=np.float64), 0.0, 1.0)[..., None]
+        result: np.ndarray[tuple[int, ...], np.dtype[np.uint8]] = np.clip(
+            start + (end - start) * t_arr, 0, 255
+        ).astype(np.uint8)
+        return result
 
     def __eq__(self, other: object) -> bool:
         """Check color equality."""
-        if not isinstance(other, Color):
+        # Duck-typed on the cached key: one slot load instead of an isinstance check
+        try:
+            return self._key == other._key  # type: ignore[attr-defined,no-any-return]
+        except AttributeError:
             return NotImplemented
-        return (self._r, self._g, self._b, self._a) == (other._r, other._g, other._b, other._a)
+
+    def __hash__(self) -> int:
+        """Hash consistent with equality, so colors can be dict keys."""
+        return hash(self._key)
 
     def __repr__(self) -> str:
         """Return string representation."""
@@ -1,9 +1,10 @@
 """Noise generation module for organic patterns with Numba JIT optimization."""
 
+import functools
 from typing import Any
 
 import numpy as np
-from numba import njit  # type: ignore[import-untyped]
+from numba import float32, float64, guvectorize, njit, prange, uint8  # type: ignore[import-untyped]
 
 
 @njit(cache=True)
@@ -18,28 +19,31 @@ def _lerp(t: Any, a: Any, b: Any) -> Any:  # type: ignore[misc]
     return a + t * (b - a)
 
 
-@njit(cache=True)
+# Eight 2D gradient directions stored flat as (gx, gy) pairs, indexed by hash & 7
+_GRAD2 = np.array(
+    [(1, 1), (-1, 1), (1, -1), (-1, -1), (1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.float32
+).reshape(-1)
+
+
+@njit(cache=True, inline="always")
 def _grad_2d(hash_val: Any, x: Any, y: Any) -> Any:  # type: ignore[misc]
-    """Gradient function for 2D (scalar version)."""
-    h = hash_val & 3
-    if h == 0:
-        return x + y
-    elif h == 1:
-        return -x + y
-    elif h == 2:
-        return x - y
-    else:
-        return -x - y
+    """Gradient function for 2D (scalar version).
 
+    Looks the gradient up in the flat ``_GRAD2`` table: two loads and a dot
+    product, with no branches or trigonometry.
+    """
+    gi = (hash_val & 7) * 2
+    return _GRAD2[gi] * x + _GRAD2[gi + 1] * y
 
-@njit(cache=True)
+
+@njit(fastmath=True, cache=True)
 def _perlin_noise_2d_scalar(x: Any, y: Any, perm: Any) -> Any:  # type: ignore[misc]
     """Core Perlin noise computation for scalar inputs (JIT compiled).
 
     Args:
         x: X coordinate
         y: Y coordinate
-        perm: Permutation table (length 512)
+        perm: Permutation table (512 uint8 entries)
 
     Returns:
         Noise value in range [-1, 1]
@@ -56,11 +60,13 @@ def _perlin_noise_2d_scalar(x: Any, y: Any, perm: Any) -> Any:  # type: ignore[m
     u = _fade(xf)
     v = _fade(yf)
 
-    # Hash coordinates of the 4 cube corners
-    aa = perm[perm[xi] + yi]
-    ab = perm[perm[xi] + yi + 1]
-    ba = perm[perm[xi + 1] + yi]
-    bb = perm[perm[xi + 1] + yi + 1]
+    # Hash coordinates of the 4 cube corners (the doubled table absorbs the wrap)
+    a = perm[xi]
+    b = perm[xi + 1]
+    aa = perm[a + yi]
+    ab = perm[a + yi + 1]
+    ba = perm[b + yi]
+    bb = perm[b + yi + 1]
 
     # Calculate gradient values
     g1 = _grad_2d(aa, xf, yf)
@@ -75,30 +81,37 @@ def _perlin_noise_2d_scalar(x: Any, y: Any, perm: Any) -> Any:  # type: ignore[m
     return _lerp(v, x1, x2)
 
 
-@njit(cache=True)
-def _perlin_noise_2d_array(x: Any, y: Any, perm: Any) -> Any:  # type: ignore[misc]
-    """Core Perlin noise computation for array inputs (JIT compiled).
+@njit(fastmath=True, cache=True)
+def _octave_sum(  # type: ignore[misc]
+    x: Any, y: Any, perm: Any, octaves: Any, persistence: Any, lacunarity: Any
+) -> Any:
+    """Sum of amplitude-weighted octaves, before normalization (JIT compiled)."""
+    total = 0.0
+    amplitude = 1.0
+    frequency = 1.0
 
-    Args:
-        x: X coordinate(s) as array
-        y: Y coordinate(s) as array
-        perm: Permutation table (length 512)
+    for _ in range(octaves):
+        total += _perlin_noise_2d_scalar(x * frequency, y * frequency, perm) * amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
 
-    Returns:
-        Noise value(s) in range [-1, 1]
-    """
-    # Ensure arrays
-    x_flat = x.flatten()
-    y_flat = y.flatten()
-    result = np.empty(len(x_flat), dtype=np.float64)
+    return total
 
-    for i in range(len(x_flat)):
-        result[i] = _perlin_noise_2d_scalar(x_flat[i], y_flat[i], perm)
 
-    return result.reshape(x.shape)
+@njit(cache=True)
+def _amplitude_sum(octaves: Any, persistence: Any) -> Any:  # type: ignore[misc]
+    """Sum of octave amplitudes, used to normalize octave noise to [-1, 1]."""
+    max_value = 0.0
+    amplitude = 1.0
 
+    for _ in range(octaves):
+        max_value += amplitude
+        amplitude *= persistence
 
-@njit(cache=True)
+    return max_value
+
+
+@njit(fastmath=True, cache=True)
 def _octave_noise_2d_scalar(  # type: ignore[misc]
     x: Any, y: Any, perm: Any, octaves: Any, persistence: Any, lacunarity: Any
 ) -> Any:
@@ -115,47 +128,98 @@ def _octave_noise_2d_scalar(  # type: ignore[misc]
     Returns:
         Combined noise value
     """
-    total = 0.0
-    amplitude = 1.0
-    frequency = 1.0
-    max_value = 0.0
+    total = _octave_sum(x, y, perm, octaves, persistence, lacunarity)
+    return total / _amplitude_sum(octaves, persistence)
 
-    for _ in range(octaves):
-        total += _perlin_noise_2d_scalar(x * frequency, y * frequency, perm) * amplitude
-        max_value += amplitude
-        amplitude *= persistence
-        frequency *= lacunarity
 
-    return total / max_value
+@guvectorize(  # type: ignore[no-untyped-call,untyped-decorator]
+    [(float32, float32, uint8[:], float32[:]), (float64, float64, uint8[:], float64[:])],
+    "(),(),(n)->()",
+    nopython=True,
+    target="parallel",
+    cache=True,
+)
+def _perlin_noise_2d_gufunc(x: Any, y: Any, perm: Any, out: Any) -> None:  # type: ignore[misc]
+    """Perlin noise as a parallel gufunc (JIT compiled).
 
+    NumPy broadcasts x and y of any shape and the parallel target splits the
+    elements across threads, so no flattening or reshaping is needed.
 
-@njit(cache=True)
-def _octave_noise_2d_array(  # type: ignore[misc]
-    x: Any, y: Any, perm: Any, octaves: Any, persistence: Any, lacunarity: Any
-) -> Any:
-    """Multi-octave Perlin noise for array inputs (JIT compiled).
+    Args:
+        x: X coordinate
+        y: Y coordinate
+        perm: Permutation table (512 uint8 entries)
+        out: Output element for the noise value in range [-1, 1]
+    """
+    out[0] = _perlin_noise_2d_scalar(x, y, perm)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _octave_noise_2d_grid(  # type: ignore[misc]
+    x: Any, y: Any, perm: Any, octaves: Any, persistence: Any, lacunarity: Any, out: Any
+) -> None:
+    """Multi-octave Perlin noise for 2D coordinate grids (JIT compiled).
+
+    The octave loop runs per element, so frequency and amplitude stay in
+    registers instead of materializing one temporary grid per octave. The
+    normalization factor is computed once per call rather than per element.
 
     Args:
-        x: X coordinate(s)
-        y: Y coordinate(s)
+        x: X coordinates as a 2D array
+        y: Y coordinates as a 2D array of the same shape
         perm: Permutation table
         octaves: Number of noise layers to combine
         persistence: Amplitude multiplier per octave
         lacunarity: Frequency multiplier per octave
+        out: Output array of the same shape as x, receives the combined noise
+    """
+    scale = 1.0 / _amplitude_sum(octaves, persistence)
 
-    Returns:
-        Combined noise value(s)
+    for i in prange(x.shape[0]):
+        for j in range(x.shape[1]):
+            out[i, j] = (
+                _octave_sum(x[i, j], y[i, j], perm, octaves, persistence, lacunarity) * scale
+            )
+
+
+def _as_coords(x: float | np.ndarray, y: float | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Convert array coordinates to a shared float dtype.
+
+    float32 is only used when the caller already passes float32, so other
+    inputs keep float64 precision for large coordinates. Python scalars stay
+    weakly typed (NEP 50), so a float32 array paired with 0.5 stays float32.
     """
-    x_flat = x.flatten()
-    y_flat = y.flatten()
-    result = np.empty(len(x_flat), dtype=np.float64)
+    x_arr, y_arr = np.asarray(x), np.asarray(y)
+    dtype = np.result_type(
+        *(v if isinstance(v, (int, float)) else arr for v, arr in ((x, x_arr), (y, y_arr))),
+        np.float32,
+    )
+    return x_arr.astype(dtype, copy=False), y_arr.astype(dtype, copy=False)
 
-    for i in range(len(x_flat)):
-        result[i] = _octave_noise_2d_scalar(
-            x_flat[i], y_flat[i], perm, octaves, persistence, lacunarity
-        )
 
-    return result.reshape(x.shape)
+def _as_grid(arr: np.ndarray) -> np.ndarray:
+    """Return a 2D view of a (non-scalar) coordinate array for the grid kernels."""
+    return arr.reshape(-1, arr.shape[-1])
+
+
+def _build_perm(seed: int | None) -> np.ndarray:
+    """Build a read-only permutation table for a seed.
+
+    The table is doubled so corner hashes never need wrapping (512 bytes, small
+    enough to stay in L1). A seed of None draws a fresh random table.
+    """
+    rng = np.random.default_rng(seed)
+    perm = np.arange(256, dtype=np.uint8)
+    rng.shuffle(perm)
+    table = np.concatenate([perm, perm])
+    table.setflags(write=False)
+    return table
+
+
+@functools.lru_cache(maxsize=128)
+def _shared_perm(seed: int) -> np.ndarray:
+    """Return the permutation table for an integer seed, shared between generators."""
+    return _build_perm(seed)
 
 
 class PerlinNoise:
@@ -166,38 +230,53 @@ class PerlinNoise:
     a moment, but subsequent calls will be very fast.
     """
 
-    def __init__(self, seed: int = 0) -> None:
+    def __init__(self, seed: int | None = 0) -> None:
         """Initialize Perlin noise generator.
 
         Args:
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility; None draws a fresh random table
         """
         self._seed = seed
-        rng = np.random.default_rng(seed)
-
-        # Generate permutation table
-        perm = np.arange(256, dtype=np.int32)
-        rng.shuffle(perm)
-        self._perm = np.concatenate([perm, perm])
+        # Only integer seeds are reproducible, so only those share a cached table
+        if isinstance(seed, (int, np.integer)):
+            self._perm = _shared_perm(int(seed))
+        else:
+            self._perm = _build_perm(seed)
 
-    def noise(self, x: float | np.ndarray, y: float | np.ndarray) -> float | np.ndarray:
+    def noise(
+        self,
+        x: float | np.ndarray,
+        y: float | np.ndarray,
+        out: np.ndarray | None = None,
+    ) -> float | np.ndarray:
         """Generate 2D Perlin noise.
 
         Args:
             x: X coordinate(s)
             y: Y coordinate(s)
+            out: Optional array shaped like the broadcast of x and y, with the
+                result dtype, to write array results into so callers can reuse
+                one buffer
 
         Returns:
-            Noise value(s) in range [-1, 1]
+            Noise value(s) in range [-1, 1]; array inputs yield float32 arrays
+            for float32 coordinates and float64 arrays otherwise
         """
-        # Handle scalar inputs
-        if isinstance(x, int | float) and isinstance(y, int | float):
+        # Handle scalar inputs (Python numbers, NumPy scalars and 0-d arrays)
+        if np.ndim(x) == 0 and np.ndim(y) == 0:
             return _perlin_noise_2d_scalar(float(x), float(y), self._perm)
 
         # Handle array inputs
-        x_arr = np.asarray(x, dtype=np.float64)
-        y_arr = np.asarray(y, dtype=np.float64)
-        return _perlin_noise_2d_array(x_arr, y_arr, self._perm)
+        x_arr, y_arr = _as_coords(x, y)
+        if out is None:
+            return _perlin_noise_2d_gufunc(x_arr, y_arr, self._perm)
+        if out.shape != np.broadcast_shapes(x_arr.shape, y_arr.shape) or out.dtype != x_arr.dtype:
+            raise ValueError(
+                f"out must be a {x_arr.dtype} array shaped like the broadcast of x and y"
+            )
+
+        _perlin_noise_2d_gufunc(x_arr, y_arr, self._perm, out=out)
+        return out
 
     def octave_noise(
         self,
@@ -206,6 +285,7 @@ class PerlinNoise:
         octaves: int = 4,
         persistence: float = 0.5,
         lacunarity: float = 2.0,
+        out: np.ndarray | None = None,
     ) -> float | np.ndarray:
         """Generate multi-octave Perlin noise (fractal noise).
 
@@ -215,17 +295,41 @@ class PerlinNoise:
             octaves: Number of noise layers to combine
             persistence: Amplitude multiplier per octave (0-1)
             lacunarity: Frequency multiplier per octave (>1)
+            out: Optional C-contiguous array shaped like the broadcast of x and y,
+                with the result dtype, to write array results into so callers can
+                reuse one buffer
 
         Returns:
-            Combined noise value(s)
+            Combined noise value(s); array inputs yield float32 arrays for
+            float32 coordinates and float64 arrays otherwise
         """
-        # Handle scalar inputs
-        if isinstance(x, int | float) and isinstance(y, int | float):
+        # Handle scalar inputs (Python numbers, NumPy scalars and 0-d arrays)
+        if np.ndim(x) == 0 and np.ndim(y) == 0:
             return _octave_noise_2d_scalar(
                 float(x), float(y), self._perm, octaves, persistence, lacunarity
             )
 
         # Handle array inputs
-        x_arr = np.asarray(x, dtype=np.float64)
-        y_arr = np.asarray(y, dtype=np.float64)
-        return _octave_noise_2d_array(x_arr, y_arr, self._perm, octaves, persistence, lacunarity)
+        # The grid kernel indexes x and y in lockstep without bounds checks, so
+        # broadcast them to one contiguous shape first
+        x_arr, y_arr = (np.ascontiguousarray(arr) for arr in np.broadcast_arrays(*_as_coords(x, y)))
+        if out is None:
+            out = np.empty(x_arr.shape, dtype=x_arr.dtype)
+        elif out.shape != x_arr.shape or out.dtype != x_arr.dtype or not out.flags.c_contiguous:
+            raise ValueError(
+                f"out must be a C-contiguous {x_arr.dtype} array shaped like the broadcast"
+                " of x and y"
+            )
+        if out.size == 0:
+            return out
+
+        _octave_noise_2d_grid(
+            _as_grid(x_arr),
+            _as_grid(y_arr),
+            self._perm,
+            octaves,
+            persistence,
+            lacunarity,
+            _as_grid(out),
+        )
+        return out
@@ -1,9 +1,13 @@
 """Utility functions for generative art."""
 
+import math
 import random
+from typing import Any
 
 import numpy as np
 
+_FloatArray = np.ndarray[tuple[int, ...], np.dtype[np.floating[Any]]]
+
 
 def seed(value: int) -> None:
     """Set random seed for reproducible results.
@@ -18,12 +22,19 @@ def seed(value: int) -> None:
 
 
 def map_range(
-    value: float, in_min: float, in_max: float, out_min: float, out_max: float, clamp: bool = False
-) -> float:
+    value: float | _FloatArray,
+    in_min: float,
+    in_max: float,
+    out_min: float,
+    out_max: float,
+    clamp: bool = False,
+) -> float | _FloatArray:
     """Map a value from one range to another.
 
+    Accepts scalars or NumPy arrays; arrays are mapped element-wise.
+
     Args:
-        value: Input value
+        value: Input value(s)
         in_min: Minimum of input range
         in_max: Maximum of input range
         out_min: Minimum of output range
@@ -31,47 +42,62 @@ def map_range(
         clamp: Whether to clamp result to output range
 
     Returns:
-        Mapped value
+        Mapped value(s)
     """
     result = (value - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
 
     if clamp:
-        result = max(out_min, min(out_max, result))
+        result = constrain(result, out_min, out_max)
 
     return result
 
 
-def constrain(value: float, min_val: float, max_val: float) -> float:
+def constrain(value: float | _FloatArray, min_val: float, max_val: float) -> float | _FloatArray:
     """Constrain a value to a range.
 
+    Accepts scalars or NumPy arrays; arrays are constrained element-wise.
+
     Args:
-        value: Value to constrain
+        value: Value(s) to constrain
         min_val: Minimum value
         max_val: Maximum value
 
     Returns:
-        Constrained value
+        Constrained value(s)
     """
+    if isinstance(value, np.ndarray):
+        return np.maximum(min_val, np.minimum(max_val, value))
     return max(min_val, min(max_val, value))
 
 
-def lerp(start: float, stop: float, amount: float) -> float:
+def lerp(
+    start: float | _FloatArray, stop: float | _FloatArray, amount: float | _FloatArray
+) -> float | _FloatArray:
     """Linear interpolation between two values.
 
+    Any argument may be a NumPy array; arrays broadcast element-wise.
+
     Args:
-        start: Starting value
-        stop: Ending value
-        amount: Interpolation amount (0-1)
+        start: Starting value(s)
+        stop: Ending value(s)
+        amount: Interpolation amount(s) (0-1)
 
     Returns:
-        Interpolated value
+        Interpolated value(s)
     """
     return start + (stop - start) * amount
 
 
-def distance(x1: float, y1: float, x2: float, y2: float) -> float:
+def distance(
+    x1: float | _FloatArray,
+    y1: float | _FloatArray,
+    x2: float | _FloatArray,
+    y2: float | _FloatArray,
+) -> float | _FloatArray:
     """Calculate Euclidean distance between two points.
 
+    Coordinates may be NumPy arrays, giving element-wise distances.
+
     Args:
         x1: X coordinate of first point
         y1: Y coordinate of first point
@@ -81,4 +107,58 @@ def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     Returns:
         Distance between points
     """
-    return float(np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2))
+    dx = x2 - x1
+    dy = y2 - y1
+    if isinstance(dx, np.ndarray) or isinstance(dy, np.ndarray):
+        return np.hypot(dx, dy)
+    return math.hypot(dx, dy)
+
+
+def sq_distance(
+    x1: float | _FloatArray,
+    y1: float | _FloatArray,
+    x2: float | _FloatArray,
+    y2: float | _FloatArray,
+) -> float | _FloatArray:
+    """Calculate squared Euclidean distance between two points.
+
+    Squared distances order the same way as distances, so use this instead of
+    ``distance`` when only comparing (e.g. "is A closer than B") to skip the
+    square root. Coordinates may be NumPy arrays, giving element-wise results.
+
+    Args:
+        x1: X coordinate of first point
+        y1: Y coordinate of first point
+        x2: X coordinate of second point
+        y2: Y coordinate of second point
+
+    Returns:
+        Squared distance between points
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
+
+
+def make_grid(
+    width: int, height: int, xmin: float, xmax: float, ymin: float, ymax: float
+) -> tuple[
+    np.ndarray[tuple[int], np.dtype[np.float64]], np.ndarray[tuple[int], np.dtype[np.float64]]
+]:
+    """Create evenly spaced sample coordinates for an image grid.
+
+    The axes are returned as 1D arrays so they can be computed once and shared
+    between renders; use ``np.meshgrid`` on them when full 2D grids are needed.
+
+    Args:
+        width: Number of samples along the x axis
+        height: Number of samples along the y axis
+        xmin: First x coordinate
+        xmax: Last x coordinate
+        ymin: First y coordinate
+        ymax: Last y coordinate
+
+    Returns:
+        Tuple of (x_coords, y_coords) with lengths width and height
+    """
+    return np.linspace(xmin, xmax, width), np.linspace(ymin, ymax, height)
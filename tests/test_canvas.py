@@ -79,6 +79,12 @@ def test_pixels_property():
     assert pixels.shape == (5, 5, 3)
     assert np.all(pixels == 0)
 
+    # The view is read-only and tracks later canvas changes
+    with pytest.raises(ValueError):
+        pixels[0, 0] = 255
+    canvas.set_pixel(1, 1, WHITE)
+    assert np.all(pixels[1, 1] == 255)
+
 
 def test_save_and_load_canvas():
     """Test saving and loading canvas from file."""
@@ -98,9 +104,155 @@ def test_save_and_load_canvas():
         assert loaded.get_pixel(5, 5).r > 200  # Account for compression artifacts
 
 
+def test_save_ppm():
+    """Test saving canvas as raw PPM."""
+    canvas = Canvas(7, 4)
+    canvas.set_pixel(3, 2, Color(10, 20, 30))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "test.ppm"
+        canvas.save(filepath)
+
+        assert filepath.read_bytes().startswith(b"P6\n7 4\n255\n")
+        loaded = Canvas.from_image(filepath)
+        assert np.array_equal(loaded.pixels, canvas.pixels)
+
+
+def test_save_reuses_encoding():
+    """Test repeated saves reuse the encoding until the canvas changes."""
+    canvas = Canvas(8, 8)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        first = Path(tmpdir) / "first.png"
+        second = Path(tmpdir) / "second.png"
+        canvas.save(first)
+        encoded = canvas._encoded
+        canvas.save(second)
+
+        assert canvas._encoded is encoded
+        assert first.read_bytes() == second.read_bytes()
+
+        canvas.set_pixel(1, 1, Color(255, 0, 0))
+        canvas.save(second)
+
+        assert canvas._encoded is not encoded
+        assert Canvas.from_image(second).get_pixel(1, 1) == Color(255, 0, 0)
+
+
+def test_dirty_regions():
+    """Test tile-based tracking of changed regions."""
+    canvas = Canvas(100, 70)
+    assert canvas.dirty_regions() == [(0, 0, 100, 70)]
+
+    canvas.mark_clean()
+    assert canvas.dirty_regions() == []
+
+    canvas.set_pixel(99, 69, Color(255, 0, 0))
+    canvas.set_pixel(3, 4, Color(255, 0, 0))
+    canvas.set_pixel(5, 6, Color(255, 0, 0))
+    assert canvas.dirty_regions() == [(0, 0, 64, 64), (64, 64, 100, 70)]
+
+    canvas.clear()
+    assert canvas.dirty_regions() == [(0, 0, 100, 70)]
+
+
 def test_canvas_repr():
     """Test string representation of canvas."""
     canvas = Canvas(100, 50)
     assert "Canvas" in repr(canvas)
     assert "100" in repr(canvas)
     assert "50" in repr(canvas)
+
+
+def test_set_pixels():
+    """Test setting all pixels from an array."""
+    canvas = Canvas(4, 3)
+    pixels = np.zeros((3, 4, 3), dtype=np.uint8)
+    pixels[1, 2] = (255, 0, 0)
+
+    canvas.set_pixels(pixels)
+    assert canvas.get_pixel(2, 1) == Color(255, 0, 0)
+    assert canvas.get_pixel(0, 0) == BLACK
+
+
+def test_set_pixels_invalid():
+    """Test that mismatched pixel arrays raise ValueError."""
+    canvas = Canvas(4, 3)
+
+    with pytest.raises(ValueError):
+        canvas.set_pixels(np.zeros((4, 3, 3), dtype=np.uint8))
+
+    with pytest.raises(ValueError):
+        canvas.set_pixels(np.zeros((3, 4, 3), dtype=np.float64))
+
+
+def test_set_channels():
+    """Test setting pixels from separate channel planes."""
+    for mode in ("RGB", "RGBA"):
+        canvas = Canvas(4, 3, mode=mode)
+        r = np.full((3, 4), 10, dtype=np.uint8)
+        g = np.full((3, 4), 20, dtype=np.uint8)
+        b = np.arange(12, dtype=np.uint8).reshape(3, 4)
+
+        canvas.set_channels(r, g, b)
+        assert canvas.get_pixel(3, 2) == Color(10, 20, 11)
+
+        with pytest.raises(ValueError):
+            canvas.set_channels(r, g, b.T)
+
+        with pytest.raises(ValueError):
+            canvas.set_channels(r, g, b.astype(np.float32))
+
+
+def test_rgba_mode_canvas():
+    """Test the packed RGBA layout behaves like the RGB layout."""
+    canvas = Canvas(6, 4, BLACK, mode="RGBA")
+    red = Color(255, 0, 0)
+
+    assert canvas.get_pixel(0, 0) == BLACK
+    canvas.set_pixel(2, 1, red)
+    assert canvas.get_pixel(2, 1) == red
+    assert canvas.pixels.shape == (4, 6, 3)
+
+    canvas.fill(Color(10, 20, 30))
+    assert np.all(canvas.pixels == np.array([10, 20, 30], dtype=np.uint8))
+
+    canvas.clear()
+    assert canvas.get_pixel(5, 3) == BLACK
+
+
+def test_rgba_mode_set_packed():
+    """Test setting packed pixels through a palette lookup."""
+    canvas = Canvas(3, 2, mode="RGBA")
+    palette = np.array([[255, 0, 0, 255], [0, 0, 255, 255]], dtype=np.uint8).view(np.uint32)[:, 0]
+    indices = np.array([[0, 1, 0], [1, 1, 0]])
+
+    canvas.set_packed(palette[indices])
+    assert canvas.get_pixel(0, 0) == Color(255, 0, 0)
+    assert canvas.get_pixel(1, 0) == Color(0, 0, 255)
+
+    with pytest.raises(ValueError):
+        canvas.set_packed(np.zeros((3, 2), dtype=np.uint32))
+
+    with pytest.raises(ValueError):
+        Canvas(3, 2).set_packed(palette[indices])
+
+
+def test_load_canvas_rgba_mode():
+    """Test loading an image into the packed RGBA layout."""
+    canvas = Canvas(10, 10)
+    canvas.set_pixel(5, 5, Color(255, 0, 0))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "test.png"
+        canvas.save(filepath)
+
+        loaded = Canvas.from_image(filepath, mode="RGBA")
+        assert loaded.mode == "RGBA"
+        assert np.array_equal(loaded.pixels, canvas.pixels)
+
+
+def test_canvas_invalid_mode():
+    """Test that unknown modes raise ValueError."""
+    with pytest.raises(ValueError):
+        Canvas(10, 10, mode="CMYK")
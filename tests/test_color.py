@@ -1,5 +1,7 @@
 """Tests for the Color class."""
 
+import colorsys
+
 import numpy as np
 import pytest
 
@@ -65,6 +67,15 @@ def test_color_from_hex_invalid():
     with pytest.raises(ValueError):
         Color.from_hex("#fffffff")  # Too long
 
+    with pytest.raises(ValueError):
+        Color.from_hex("#-10000")  # Not hex digits
+
+    with pytest.raises(ValueError):
+        Color.from_hex("#ff_fff")  # Underscore accepted by int()
+
+    with pytest.raises(ValueError):
+        Color.from_hex("#gg0000")  # Invalid digit
+
 
 def test_color_from_hsv():
     """Test creation from HSV values."""
@@ -100,6 +111,43 @@ def test_color_lerp():
     assert BLACK.lerp(WHITE, 1.0) == WHITE
 
 
+def test_color_lerp_array():
+    """Test vectorized interpolation matches scalar lerp."""
+    start = Color(0, 100, 200)
+    end = Color(200, 50, 50)
+    t = np.array([-0.5, 0.0, 0.3, 0.5, 0.77, 1.0, 2.0])
+
+    result = Color.lerp_array(start, end, t)
+
+    assert result.shape == (7, 3)
+    assert result.dtype == np.uint8
+    for i, ti in enumerate(t):
+        assert tuple(result[i]) == start.lerp(end, ti).to_tuple()
+
+
+def test_color_lerp_array_rgb_endpoints():
+    """Test vectorized interpolation with per-element RGB endpoints."""
+    starts = np.array([[0, 0, 0], [255, 0, 0]], dtype=np.uint8)
+    ends = np.array([[255, 255, 255], [0, 0, 255]], dtype=np.uint8)
+
+    result = Color.lerp_array(starts, ends, np.array([0.5, 1.0]))
+
+    assert tuple(result[0]) == BLACK.lerp(WHITE, 0.5).to_tuple()
+    assert tuple(result[1]) == (0, 0, 255)
+
+
+def test_color_lerp_array_clamps_endpoints():
+    """Test out-of-range array endpoints are clamped like Color."""
+    result = Color.lerp_array([0, 0, 0], [300, -20, 0], np.array([0.5, 1.0]))
+
+    assert tuple(result[1]) == Color(300, -20, 0).to_tuple()
+    assert tuple(result[0]) == (150, 0, 0)
+    assert tuple(Color.lerp_array([-50, 400, 10], WHITE, 0.0)) == (0, 255, 10)
+
+    with pytest.raises(ValueError):
+        Color.lerp_array(np.zeros((2, 4)), np.ones((2, 4)), 0.5)
+
+
 def test_color_equality():
     """Test color equality comparison."""
     color1 = Color(100, 150, 200)
@@ -108,6 +156,26 @@ def test_color_equality():
 
     assert color1 == color2
     assert color1 != color3
+    assert color1 != (100, 150, 200)
+    assert color1 != "#6496c8"
+
+
+def test_color_hash():
+    """Test colors can be used as dictionary keys."""
+    palette = {Color(100, 150, 200): "sky", BLACK: "ink"}
+
+    assert palette[Color(100, 150, 200)] == "sky"
+    assert palette[Color.from_hex("#000000")] == "ink"
+    assert len({Color(1, 2, 3), Color(1, 2, 3), Color(1, 2, 3, 0)}) == 2
+
+
+def test_color_slots():
+    """Test colors do not carry a per-instance __dict__."""
+    color = Color(1, 2, 3)
+
+    assert not hasattr(color, "__dict__")
+    with pytest.raises(AttributeError):
+        color.extra = 1  # type: ignore[attr-defined]
 
 
 def test_color_constants():
@@ -126,3 +194,53 @@ def test_color_repr():
     assert "100" in repr(color)
     assert "150" in repr(color)
     assert "200" in repr(color)
+
+
+def test_color_from_hsv_array():
+    """Test vectorized HSV conversion matches scalar conversion."""
+    h = np.array([[0.0, 120.0, 240.0], [45.5, 200.0, 359.9]])
+    s = np.array([[1.0, 1.0, 1.0], [0.3, 0.8, 1.5]])
+    v = np.array([[1.0, 1.0, 1.0], [0.7, 0.2, -0.1]])
+
+    rgb = Color.from_hsv_array(h, s, v)
+
+    assert rgb.shape == (2, 3, 3)
+    assert rgb.dtype == np.uint8
+    for i in range(2):
+        for j in range(3):
+            expected = Color.from_hsv(h[i, j], s[i, j], v[i, j])
+            assert tuple(rgb[i, j]) == expected.to_tuple()
+
+
+def test_color_from_hsv_array_round_trip_parity():
+    """Test scalar and vectorized HSV conversion agree on round-tripped colors."""
+    levels = np.arange(0, 256, 15) / 255
+    r, g, b = (channel.ravel() for channel in np.meshgrid(levels, levels, levels))
+    hsv = np.array([colorsys.rgb_to_hsv(*rgb) for rgb in zip(r, g, b, strict=True)])
+    h, s, v = hsv[:, 0] * 360, hsv[:, 1], hsv[:, 2]
+
+    rgb = Color.from_hsv_array(h, s, v)
+
+    for i in range(len(h)):
+        assert tuple(rgb[i]) == Color.from_hsv(h[i], s[i], v[i]).to_tuple()[:3]
+    # Cases where the sextant and branchless forms used to round differently
+    assert Color.from_hsv(0, 0.1, 100 / 255).to_tuple()[:3] == (100, 89, 89)
+    assert tuple(Color.from_hsv_array(0, 0.1, 100 / 255)) == (100, 89, 89)
+    assert (
+        tuple(Color.from_hsv_array(3, 1, 100 / 255))
+        == Color.from_hsv(3, 1, 100 / 255).to_tuple()[:3]
+    )
+
+
+def test_color_from_hsv_array_float32():
+    """Test vectorized HSV conversion of float32 inputs."""
+    h = np.linspace(0, 359, 50, dtype=np.float32)
+    s = np.full(50, 0.9, dtype=np.float32)
+    v = np.full(50, 0.8, dtype=np.float32)
+
+    rgb = Color.from_hsv_array(h, s, v)
+
+    assert rgb.shape == (50, 3)
+    for i in range(50):
+        expected = Color.from_hsv(float(h[i]), float(s[i]), float(v[i])).to_tuple()
+        assert np.all(np.abs(rgb[i].astype(int) - expected) <= 1)
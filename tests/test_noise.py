@@ -1,8 +1,9 @@
 """Tests for noise generation."""
 
 import numpy as np
+import pytest
 
-from myon.noise import PerlinNoise
+from myon.noise import _GRAD2, PerlinNoise
 
 
 def test_perlin_noise_initialization():
@@ -19,6 +20,9 @@ def test_perlin_noise_single_value():
     assert isinstance(value, float)
     assert -1.0 <= value <= 1.0
 
+    # NumPy scalars take the scalar path too
+    assert noise.noise(np.float32(0.5), np.float64(0.5)) == value
+
 
 def test_perlin_noise_array():
     """Test generating noise for arrays."""
@@ -33,6 +37,46 @@ def test_perlin_noise_array():
     assert np.all(values <= 1.0)
 
 
+def _reference_noise(x, y, perm):
+    """Whole-array NumPy Perlin noise used as an oracle for the JIT kernels."""
+    xi = np.floor(x).astype(np.int64)
+    yi = np.floor(y).astype(np.int64)
+    xf = x - xi
+    yf = y - yi
+    xi &= 255
+    yi &= 255
+
+    a = perm[xi].astype(np.int64)
+    b = perm[xi + 1].astype(np.int64)
+
+    def corner(h, dx, dy):
+        gi = (h.astype(np.int64) & 7) * 2
+        return np.take(_GRAD2, gi) * dx + np.take(_GRAD2, gi + 1) * dy
+
+    g1 = corner(perm[a + yi], xf, yf)
+    g2 = corner(perm[b + yi], xf - 1, yf)
+    g3 = corner(perm[a + yi + 1], xf, yf - 1)
+    g4 = corner(perm[b + yi + 1], xf - 1, yf - 1)
+
+    u = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+    v = yf * yf * yf * (yf * (yf * 6 - 15) + 10)
+    x1 = g1 + u * (g2 - g1)
+    x2 = g3 + u * (g4 - g3)
+    return x1 + v * (x2 - x1)
+
+
+def test_perlin_noise_array_matches_reference():
+    """Test the JIT array path against a pure NumPy formulation."""
+    noise = PerlinNoise(seed=7)
+    xx, yy = np.meshgrid(
+        np.linspace(-20, 300, 64, dtype=np.float32), np.linspace(-5, 5, 48, dtype=np.float32)
+    )
+
+    expected = _reference_noise(xx.astype(np.float64), yy.astype(np.float64), noise._perm)
+
+    assert np.allclose(noise.noise(xx, yy), expected, atol=1e-5)
+
+
 def test_perlin_noise_reproducibility():
     """Test that same seed produces same results."""
     noise1 = PerlinNoise(seed=42)
@@ -44,6 +88,26 @@ def test_perlin_noise_reproducibility():
     assert value1 == value2
 
 
+def test_perlin_noise_shares_permutation():
+    """Test that generators with the same seed share one read-only table."""
+    noise1 = PerlinNoise(seed=42)
+    noise2 = PerlinNoise(seed=42)
+
+    assert noise1._perm is noise2._perm
+    assert noise1._perm.shape == (512,)
+    assert not noise1._perm.flags.writeable
+    assert PerlinNoise(seed=7)._perm is not noise1._perm
+
+
+def test_perlin_noise_unseeded_tables_differ():
+    """Test that generators without a seed each draw a fresh table."""
+    noise1 = PerlinNoise(seed=None)
+    noise2 = PerlinNoise(seed=None)
+
+    assert noise1._perm is not noise2._perm
+    assert not np.array_equal(noise1._perm, noise2._perm)
+
+
 def test_perlin_noise_different_seeds():
     """Test that different seeds produce different results."""
     noise1 = PerlinNoise(seed=42)
@@ -105,3 +169,101 @@ def test_noise_continuity():
 
     # All differences should be relatively small (continuity)
     assert all(d < 0.1 for d in diffs)
+
+
+def test_noise_grid_matches_scalar():
+    """Test that 2D grid inputs match per-point scalar evaluation."""
+    noise = PerlinNoise(seed=42)
+    xx, yy = np.meshgrid(np.linspace(0, 4, 7), np.linspace(-2, 2, 5))
+
+    values = noise.noise(xx, yy)
+    octave_values = noise.octave_noise(xx, yy, octaves=3)
+
+    assert values.shape == (5, 7)
+    assert octave_values.shape == (5, 7)
+    assert values.dtype == np.float64
+    assert octave_values.dtype == np.float64
+    assert noise.noise(xx.astype(np.float32), yy.astype(np.float32)).dtype == np.float32
+    for i in range(5):
+        for j in range(7):
+            x, y = float(xx[i, j]), float(yy[i, j])
+            assert np.isclose(values[i, j], noise.noise(x, y), atol=1e-5)
+            assert np.isclose(octave_values[i, j], noise.octave_noise(x, y, octaves=3), atol=1e-5)
+
+
+def test_octave_noise_out():
+    """Test writing octave noise into a caller-provided buffer."""
+    noise = PerlinNoise(seed=42)
+    xx, yy = np.meshgrid(np.linspace(0, 4, 7), np.linspace(-2, 2, 5))
+    out = np.empty((5, 7), dtype=np.float64)
+
+    result = noise.octave_noise(xx, yy, octaves=3, out=out)
+
+    assert result is out
+    assert np.array_equal(out, noise.octave_noise(xx, yy, octaves=3))
+
+    with pytest.raises(ValueError):
+        noise.octave_noise(xx, yy, out=np.empty((7, 5), dtype=np.float64))
+    with pytest.raises(ValueError):
+        noise.octave_noise(xx, yy, out=np.empty((5, 7), dtype=np.float32))
+
+    # out is checked against the broadcast shape, not just x
+    out_row = np.empty((5, 7), dtype=np.float64)
+    assert noise.octave_noise(xx[0], yy[:, :1], octaves=3, out=out_row) is out_row
+    assert np.array_equal(out_row, out)
+    with pytest.raises(ValueError):
+        noise.octave_noise(xx[0], yy[:, :1], out=np.empty(7, dtype=np.float64))
+
+
+def test_noise_out():
+    """Test writing noise into a caller-provided buffer."""
+    noise = PerlinNoise(seed=42)
+    xs = np.linspace(0, 4, 7)
+    ys = np.linspace(-2, 2, 5)[:, None]
+    out = np.empty((5, 7), dtype=np.float64)
+
+    result = noise.noise(xs, ys, out=out)
+
+    assert result is out
+    assert np.array_equal(out, noise.noise(xs, ys))
+
+    with pytest.raises(ValueError):
+        noise.noise(xs, ys, out=np.empty((5, 7), dtype=np.float32))
+
+
+def test_octave_noise_broadcasts_and_handles_empty():
+    """Test octave noise broadcasts x against y and accepts empty arrays."""
+    noise = PerlinNoise(seed=42)
+    xs = np.arange(5.0)
+
+    result = noise.octave_noise(xs, 0.5, octaves=3)
+
+    expected = [noise.octave_noise(float(x), 0.5, octaves=3) for x in xs]
+    assert result.shape == (5,)
+    assert np.allclose(result, expected, atol=1e-5)
+    assert noise.octave_noise(np.array([]), np.array([])).shape == (0,)
+
+
+def test_noise_keeps_float64_precision():
+    """Test float64 array coordinates are not rounded to float32."""
+    noise = PerlinNoise(seed=42)
+    xs = np.array([100000.37, 250000.81])
+
+    values = noise.noise(xs, 0.25)
+    octave_values = noise.octave_noise(xs, 0.25, octaves=6)
+
+    for i, x in enumerate(xs):
+        assert abs(values[i] - noise.noise(float(x), 0.25)) < 1e-9
+        assert abs(octave_values[i] - noise.octave_noise(float(x), 0.25, octaves=6)) < 1e-9
+
+
+def test_noise_float32_with_python_scalar():
+    """Test a float32 array paired with a Python scalar stays float32."""
+    noise = PerlinNoise(seed=42)
+    xs = np.linspace(0, 4, 7, dtype=np.float32)
+
+    assert noise.noise(xs, 0.5).dtype == np.float32
+    assert noise.noise(1, xs).dtype == np.float32
+    assert noise.octave_noise(xs, 0.5, octaves=3).dtype == np.float32
+    assert noise.noise(xs, np.float64(0.5)).dtype == np.float64
+    assert noise.noise([0.5, 1.5], 0.5).dtype == np.float64
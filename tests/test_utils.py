@@ -4,7 +4,7 @@ import random
 
 import numpy as np
 
-from myon.utils import constrain, distance, lerp, map_range, seed
+from myon.utils import constrain, distance, lerp, make_grid, map_range, seed, sq_distance
 
 
 def test_seed():
@@ -44,6 +44,13 @@ def test_map_range_with_clamping():
     assert result == 0.0
 
 
+def test_map_range_endpoints():
+    """Test range endpoints map exactly onto the output endpoints."""
+    assert map_range(7, 0, 7, 0, 29) == 29
+    assert map_range(0, 0, 7, 0, 29) == 0
+    assert np.array_equal(map_range(np.array([0.0, 7.0]), 0, 7, 0, 29), [0.0, 29.0])
+
+
 def test_constrain():
     """Test value constraining."""
     assert constrain(5, 0, 10) == 5
@@ -70,3 +77,33 @@ def test_distance():
     # Test with floating point coordinates
     d = distance(0, 0, 1, 1)
     assert abs(d - np.sqrt(2)) < 1e-10
+
+
+def test_sq_distance():
+    """Test squared distance calculation."""
+    assert sq_distance(0, 0, 3, 4) == 25
+    assert sq_distance(5, 5, 5, 5) == 0
+    assert np.allclose(sq_distance(0, 0, np.array([3.0, 1.0]), np.array([4.0, 1.0])), [25.0, 2.0])
+
+
+def test_make_grid():
+    """Test grid axis generation."""
+    xs, ys = make_grid(5, 3, 0.0, 1.0, -1.0, 1.0)
+
+    assert xs.shape == (5,)
+    assert ys.shape == (3,)
+    assert np.allclose(xs, [0.0, 0.25, 0.5, 0.75, 1.0])
+    assert np.allclose(ys, [-1.0, 0.0, 1.0])
+
+
+def test_utils_accept_arrays():
+    """Test that helpers operate element-wise on NumPy arrays."""
+    values = np.array([-5.0, 5.0, 15.0])
+
+    assert np.allclose(map_range(values, 0, 10, 0, 100), [-50.0, 50.0, 150.0])
+    assert np.allclose(map_range(values, 0, 10, 0, 100, clamp=True), [0.0, 50.0, 100.0])
+    assert np.allclose(constrain(values, 0, 10), [0.0, 5.0, 10.0])
+    assert np.allclose(lerp(0, 10, np.array([0.0, 0.5, 1.0])), [0.0, 5.0, 10.0])
+    assert np.allclose(
+        distance(0, 0, np.array([3.0, 1.0]), np.array([4.0, 1.0])), [5.0, np.sqrt(2)]
+    )